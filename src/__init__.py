@@ -1,2 +1,2 @@
-from src import constants, convergence, flowshop, initial_population, job, local_search, memetic, mutation, \
-    ordonnancement, population_statistics, solution_crossover, utils, visualisation
+from src import constants, convergence, flowshop, initial_population, job, local_search, makespan, memetic, \
+    mutation, ordonnancement, population, population_statistics, solution_crossover, utils, visualisation
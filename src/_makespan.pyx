@@ -0,0 +1,143 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -fopenmp
+# distutils: extra_link_args = -fopenmp
+
+"""
+Cython implementation of the kernels of makespan.py, with the same functions and arguments. When this extension is
+compiled, makespan.py uses it in place of the Numba kernels, so Numba is not needed to run the memetic algorithm.
+
+To compile it (Cython and a C compiler with OpenMP are needed), from the root of the project:
+    cythonize -i src/_makespan.pyx
+"""
+
+import numpy as np
+from cython.parallel cimport prange
+
+# maximum number of machines handled by the kernels (size of the rows allocated on the stack)
+cdef enum:
+    MAX_MACHINES = 512
+
+# cutoff of the evaluations which are never cut short (largest int32)
+NO_CUTOFF = 2147483647
+
+
+cdef int c_makespan(const int[::1] perm, const int[:, ::1] times, int nb_jobs, int nb_machines) noexcept nogil:
+    cdef int row[MAX_MACHINES]
+    cdef int j, k, job
+    for k in range(nb_machines):
+        row[k] = 0
+    for j in range(nb_jobs):
+        job = perm[j]
+        row[0] += times[job, 0]
+        for k in range(1, nb_machines):
+            if row[k - 1] > row[k]:
+                row[k] = row[k - 1]
+            row[k] += times[job, k]
+    return row[nb_machines - 1]
+
+
+cdef int c_neighbor_position(int j, int first, int second, bint insert) noexcept nogil:
+    if not insert:
+        if j == first:
+            return second
+        if j == second:
+            return first
+        return j
+    if j == second:
+        return first
+    if first < second and first <= j < second:
+        return j + 1
+    if first > second and second < j <= first:
+        return j - 1
+    return j
+
+
+cdef int c_neighbor_makespan(const int[::1] perm, const int[:, ::1] times, const int[:, ::1] completion, int first,
+                             int second, bint insert, int nb_jobs, int nb_machines, int cutoff) noexcept nogil:
+    cdef int row[MAX_MACHINES]
+    cdef int j, k, job
+    cdef int start = first if first < second else second
+    for k in range(nb_machines):
+        row[k] = completion[start - 1, k] if start > 0 else 0
+    for j in range(start, nb_jobs):
+        job = perm[c_neighbor_position(j, first, second, insert)]
+        row[0] += times[job, 0]
+        for k in range(1, nb_machines):
+            if row[k - 1] > row[k]:
+                row[k] = row[k - 1]
+            row[k] += times[job, k]
+        if row[nb_machines - 1] >= cutoff:
+            break
+    return row[nb_machines - 1]
+
+
+def _as_int32(array):
+    return np.ascontiguousarray(array, dtype=np.int32)
+
+
+def _check_machines(times):
+    if times.shape[1] > MAX_MACHINES:
+        raise ValueError("The compiled kernels handle at most " + str(MAX_MACHINES) + " machines")
+
+
+def completion_times(perm, times, release):
+    times = _as_int32(times)
+    cdef const int[::1] c_perm = _as_int32(perm)
+    cdef const int[:, ::1] c_times = times
+    cdef const int[::1] c_release = _as_int32(release)
+    cdef int nb_jobs = c_perm.shape[0]
+    cdef int nb_machines = c_times.shape[1]
+    completion = np.empty((nb_jobs, nb_machines), dtype=np.int32)
+    cdef int[:, ::1] c_completion = completion
+    cdef int j, k, job, ready
+    for j in range(nb_jobs):
+        job = c_perm[j]
+        for k in range(nb_machines):
+            ready = c_release[k] if j == 0 else c_completion[j - 1, k]
+            if k > 0 and c_completion[j, k - 1] > ready:
+                ready = c_completion[j, k - 1]
+            c_completion[j, k] = ready + c_times[job, k]
+    return completion
+
+
+def makespan(perm, times):
+    times = _as_int32(times)
+    _check_machines(times)
+    cdef const int[::1] c_perm = _as_int32(perm)
+    cdef const int[:, ::1] c_times = times
+    return c_makespan(c_perm, c_times, c_perm.shape[0], c_times.shape[1])
+
+
+def makespan_batch(perm_matrix, times):
+    times = _as_int32(times)
+    _check_machines(times)
+    cdef const int[:, ::1] c_perm_matrix = _as_int32(perm_matrix)
+    cdef const int[:, ::1] c_times = times
+    cdef Py_ssize_t nb_permutations = c_perm_matrix.shape[0]
+    cdef int nb_jobs = c_perm_matrix.shape[1]
+    cdef int nb_machines = c_times.shape[1]
+    durations = np.empty(nb_permutations, dtype=np.int32)
+    cdef int[::1] c_durations = durations
+    cdef Py_ssize_t i
+    for i in prange(nb_permutations, nogil=True):
+        c_durations[i] = c_makespan(c_perm_matrix[i], c_times, nb_jobs, nb_machines)
+    return durations
+
+
+def neighbors_makespan_batch(perm, times, completion, neighbors, bint insert, int cutoff=NO_CUTOFF):
+    times = _as_int32(times)
+    _check_machines(times)
+    cdef const int[::1] c_perm = _as_int32(perm)
+    cdef const int[:, ::1] c_times = times
+    cdef const int[:, ::1] c_completion = _as_int32(completion)
+    cdef const int[:, ::1] c_neighbors = _as_int32(neighbors).reshape(-1, 2)
+    cdef Py_ssize_t nb_neighbors = c_neighbors.shape[0]
+    cdef int nb_jobs = c_perm.shape[0]
+    cdef int nb_machines = c_times.shape[1]
+    durations = np.empty(nb_neighbors, dtype=np.int32)
+    cdef int[::1] c_durations = durations
+    cdef Py_ssize_t i
+    for i in prange(nb_neighbors, nogil=True):
+        c_durations[i] = c_neighbor_makespan(c_perm, c_times, c_completion, c_neighbors[i, 0], c_neighbors[i, 1],
+                                             insert, nb_jobs, nb_machines, cutoff)
+    return durations
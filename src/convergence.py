@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 
 def initialize_threshold(pop_init_size):
@@ -33,6 +34,18 @@ def shannon_entropy(population):
     return entropy
 
 
+def permutations_entropy(perm_matrix):
+    """
+    calculates the shannon entropy of a population given as a matrix of permutations, identical rows are counted
+    together as identical schedulings are in shannon_entropy
+    :param perm_matrix: int32 array of shape (size of the population, nb_jobs)
+    :return: shannon entropy of the population
+    """
+    _, counts = np.unique(perm_matrix, axis=0, return_counts=True)
+    frequencies = counts / len(perm_matrix)
+    return float(-np.sum(frequencies * np.log2(frequencies)))
+
+
 def is_convergent(population, threshold):
     """
     checks the convergence of the population
@@ -41,4 +54,3 @@ def is_convergent(population, threshold):
     :return: True if the entropy is lesser than the threshold and False if it is not
     """
     return shannon_entropy(population) < threshold
-
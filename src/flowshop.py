@@ -6,7 +6,8 @@
 __author__ = 'Chams Lahlou'
 __date__ = 'Octobre 2019'
 
-from src import job
+import numpy as np
+from src import job, makespan
 
 
 class Flowshop:
@@ -17,6 +18,9 @@ class Flowshop:
         self.nb_machines = nb_machines
         # liste des jobs pour le problème
         self.l_job = l_job
+        # matrice contiguë (int32) des durées opératoires, la ligne k correspond au job numéro k,
+        # calculée une seule fois pour les calculs de durée d'ordonnancement
+        self.p = self.calculer_durees()
 
     def nombre_jobs(self):
         return self.nb_jobs
@@ -27,6 +31,14 @@ class Flowshop:
     def liste_jobs(self, num):
         return self.l_job[num]
 
+    def durees(self):
+        return self.p
+
+    def calculer_durees(self):
+        if not self.l_job:
+            return np.zeros((0, self.nb_machines), dtype=np.int32)
+        return np.ascontiguousarray(makespan.processing_times(self.l_job))
+
     def definir_par(self, nom):
         """ crée un problème de flowshop à partir d'un fichier """
         # ouverture du fichier en mode lecture
@@ -47,6 +59,7 @@ class Flowshop:
             self.l_job += [j]
         # fermeture du fichier
         fdonnees.close()
+        self.p = self.calculer_durees()
 
 
 if __name__ == "__main__":
@@ -1,18 +1,18 @@
-import copy
 import math
 import random
 import warnings
+import numpy as np
+from src import makespan
 from src.ordonnancement import Ordonnancement
 
-MAXINT = 10000
 
-
-def initial_pop(flow_shop, random_prop, deter_prop, best_deter=False, pop_init_size=100):
+def initial_pop(flow_shop, random_prop, deter_prop, rng, best_deter=False, pop_init_size=100):
     """
     Generates the initial population following a proportion of deterministic and random population
     :param flow_shop: an instance of the flow shop permutation problem
     :param deter_prop: desired proportion of the initial population computed in a deterministic manner
     :param random_prop: desired proportion of the initial population randomly generated
+    :param rng: numpy random generator used to draw the random part of the initial population
     :param best_deter: if true, select deterministic initial pop by scheduling duration, else random selection
     :param pop_init_size: size of the initial population, if bigger than the size of the total population, redefined
     to prop_total_size of the total population
@@ -34,7 +34,7 @@ def initial_pop(flow_shop, random_prop, deter_prop, best_deter=False, pop_init_s
     rdm_size = pop_init_size - len(deter_pop)
     rdm_pop = []
     if rdm_size != 0:
-        rdm_pop = random_initial_pop(flow_shop, rdm_size)
+        rdm_pop = random_initial_pop(flow_shop, rdm_size, rng)
 
     starting_pop = rdm_pop + deter_pop
     random.shuffle(starting_pop)
@@ -62,23 +62,21 @@ def is_population_size_correct(nb_jobs, pop_init_size):
     return False
 
 
-def random_initial_pop(flow_shop, rdm_size):
+def random_initial_pop(flow_shop, rdm_size, rng):
     """
     Generates randomly the initial population
     :param flow_shop: an instance of the flow shop permutation problem
     :param rdm_size: number of element in the initial population to generate
+    :param rng: numpy random generator used to draw the orders of the jobs
     :return: the random part of the initial population for the memetic algorithm
     """
-    population_seq = []
     population = []
     start = [flow_shop.liste_jobs(i) for i in range(flow_shop.nb_jobs)]
-    for i in range(rdm_size):
-        random.shuffle(start)
-        elem = copy.copy(start)
-        population_seq.append(elem)
-    for seq in population_seq:
+    # all the random orders are drawn at once, one row of indices in start per scheduling
+    orders = np.argsort(rng.random((rdm_size, flow_shop.nb_jobs)), axis=1)
+    for order in orders.tolist():
         temp_scheduling = Ordonnancement(flow_shop.nb_machines)
-        temp_scheduling.ordonnancer_liste_job(seq)
+        temp_scheduling.ordonnancer_liste_job([start[i] for i in order])
         population.append(temp_scheduling)
     return population
 
@@ -103,27 +101,20 @@ def deterministic_initial_pop(flow_shop, deter_size, best_deter):
         temp_johnson_seq = johnson_rule_order(flow_shop, sum_index)
         all_deterministic_seq.append(temp_johnson_seq)
 
-    deter_pop = []
     if best_deter:
-        all_deterministic_ordo = []
-        for seq in all_deterministic_seq:
-            sched = Ordonnancement(flow_shop.nb_machines)
-            sched.ordonnancer_liste_job(seq)
-            all_deterministic_ordo.append(sched)
-        sorted_scheduling = sorted(all_deterministic_ordo, key=lambda o: o.duree(), reverse=False)
-        if deter_size > len(sorted_scheduling):
-            deter_pop = sorted_scheduling
-        else:
-            deter_pop = sorted_scheduling[0:deter_size]
+        durations = makespan.makespan_batch(makespan.permutation_matrix(all_deterministic_seq), flow_shop.durees())
+        sorted_indices = np.argsort(durations, kind='stable')
+        seq_deter_sample = [all_deterministic_seq[index] for index in sorted_indices[0:deter_size]]
     else:
         if deter_size > len(all_deterministic_seq):
             seq_deter_sample = all_deterministic_seq
         else:
             seq_deter_sample = random.sample(all_deterministic_seq, deter_size)
-        for seq in seq_deter_sample:
-            sched = Ordonnancement(flow_shop.nb_machines)
-            sched.ordonnancer_liste_job(seq)
-            deter_pop.append(sched)
+    deter_pop = []
+    for seq in seq_deter_sample:
+        sched = Ordonnancement(flow_shop.nb_machines)
+        sched.ordonnancer_liste_job(seq)
+        deter_pop.append(sched)
     return deter_pop
 
 
@@ -134,20 +125,15 @@ def neh_order(flow_shop):
     :return: return the NEH scheduling of flow_shop
     """
     sorted_jobs = sorted(flow_shop.l_job, key=lambda j: j.duree(), reverse=True)
-    best_order = []
+    best_order = np.empty(0, dtype=np.int32)
     for job in sorted_jobs:
-        min_duration = MAXINT
-        best_pos = 0
-        for i in range(0, len(best_order) + 1):
-            scheduling = Ordonnancement(flow_shop.nb_machines)
-            new_list = [j for j in best_order]
-            new_list.insert(i, job)
-            scheduling.ordonnancer_liste_job(new_list)
-            if scheduling.duree() < min_duration:
-                min_duration = scheduling.duree()
-                best_pos = i
-        best_order.insert(best_pos, job)
-    return best_order
+        # all the insertion positions of the job are evaluated together, the first best one is kept
+        candidates = np.array([np.insert(best_order, i, job.numero()) for i in range(0, len(best_order) + 1)],
+                              dtype=np.int32)
+        durations = makespan.makespan_batch(candidates, flow_shop.durees())
+        best_order = candidates[np.argmin(durations)]
+    jobs = {job.numero(): job for job in flow_shop.l_job}
+    return [jobs[number] for number in best_order]
 
 
 def johnson_rule_order(flow_shop, sum_index):
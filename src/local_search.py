@@ -1,10 +1,12 @@
 import copy
 import random
+import numpy as np
+from src import makespan
 from src.ordonnancement import Ordonnancement
 
 
 def local_search(population, maximum_nb_iterations, max_neighbors_nb, local_search_swap_prob,
-                 local_search_insert_prob, swap_neighbors, insert_neighbors, nb_sched):
+                 local_search_insert_prob, swap_neighbors, insert_neighbors, nb_sched, times):
     """
     Generates a new population by improving each scheduling with a local search method during the given maximum number
     of iterations
@@ -13,9 +15,10 @@ def local_search(population, maximum_nb_iterations, max_neighbors_nb, local_sear
     :param max_neighbors_nb: number of neighbors to visit at each iteration
     :param local_search_swap_prob: probability of using the swap local search for a scheduling in the population
     :param local_search_insert_prob: probability of using the insert local search for a scheduling in the population
-    :param swap_neighbors: the list of neighbors for the swap method
-    :param insert_neighbors: the list of neighbors for the insert method
+    :param swap_neighbors: array of the neighbors for the swap method (see create_swap_neighbors)
+    :param insert_neighbors: array of the neighbors for the insert method (see create_insert_neighbors)
     :param nb_sched: the number of schedulings over which to do a local search
+    :param times: matrix of the processing times of the flowshop (see Flowshop.durees)
     :return: new population after local search improvements
     """
     sum_prob = local_search_swap_prob + local_search_insert_prob
@@ -27,9 +30,10 @@ def local_search(population, maximum_nb_iterations, max_neighbors_nb, local_sear
     for scheduling in population:
         if index < nb_sched:
             method_random = random.random()
-            new_scheduling = local_search_swap(scheduling, maximum_nb_iterations, max_neighbors_nb, swap_neighbors) \
+            new_scheduling = local_search_swap(scheduling, maximum_nb_iterations, max_neighbors_nb, swap_neighbors,
+                                               times) \
                 if method_random < local_search_swap_prob \
-                else local_search_insert(scheduling, maximum_nb_iterations, max_neighbors_nb, insert_neighbors)
+                else local_search_insert(scheduling, maximum_nb_iterations, max_neighbors_nb, insert_neighbors, times)
             new_population.append(new_scheduling)
         else:
             new_population.append(scheduling)
@@ -48,19 +52,19 @@ def swap(i, j, scheduling):
 
 def create_swap_neighbors(flowshop):
     """
-    creates a list of neighbors for the swap local search method
+    creates the neighbors for the swap local search method
     :param flowshop: instance of flowshop problem
-    :return: the list of neighbors for the swap method
+    :return: int32 array of shape (nb_neighbors, 2), each row is the pair of positions to swap
     """
     nb_jobs = flowshop.nombre_jobs()
     neighbors = []
     for i in range(nb_jobs-1):
         for j in range(i+1, nb_jobs):
             neighbors.append([i, j])
-    return neighbors
+    return np.array(neighbors, dtype=np.int32).reshape(-1, 2)
 
 
-def local_search_swap(scheduling, iteration, max_neighbors_nb, neighbors):
+def local_search_swap(scheduling, iteration, max_neighbors_nb, neighbors, times):
     """
     Returns a (new) scheduling after local search on the given initial scheduling during the maximum number of
     iterations given to find a minimum local, given an instance of the flowshop population (swap neighborhood)
@@ -68,41 +72,18 @@ def local_search_swap(scheduling, iteration, max_neighbors_nb, neighbors):
     :param scheduling: a scheduling (Ordonnancement object)
     :param iteration: maximum number of iterations (explorations of the swap neighborhood) to find a minimum local
     :param max_neighbors_nb: number of neighbors to visit at each iteration
-    :param neighbors: list of neighbors
+    :param neighbors: array of neighbors (see create_swap_neighbors)
+    :param times: matrix of the processing times of the flowshop (see Flowshop.durees)
     :return: the scheduling after the given number of iteration of local search
     """
-    best_scheduling = copy.copy(scheduling)
-    candidate = copy.copy(scheduling)
-    duration = best_scheduling.duree()
-    duration_candidate = candidate.duree()
-    if max_neighbors_nb > len(neighbors):
-        max_neighbors_nb = len(neighbors)
-
-    for a in range(0, iteration):
-        visited_neighbors = neighbors.copy()
-        for k in range(max_neighbors_nb):
-            index = random.randint(0, len(visited_neighbors) - 1)
-            i, j = visited_neighbors[index][0], visited_neighbors[index][1]
-            visited_neighbors.pop(index)
-            temp = copy.copy(best_scheduling)
-            ls_swap = swap(i, j, temp)
-            duration_temp = ls_swap.duree()
-            if duration_temp < duration_candidate:
-                duration_candidate = duration_temp
-                candidate = ls_swap
-        if duration > duration_candidate:
-            best_scheduling = candidate
-            duration = duration_candidate
-        else:
-            break
-    return best_scheduling
+    return local_search_neighborhood(scheduling, iteration, max_neighbors_nb, neighbors, times, False)
 
 
 def create_insert_neighbors(flowshop):
     """
-    creates a list of neighbors for the insert local search method
+    creates the neighbors for the insert local search method
     :param flowshop: instance of flowshop problem
-    :return: the list of neighbors
+    :return: int32 array of shape (nb_neighbors, 2), each row is the position of the job to move and its new position
     """
     nb_jobs = flowshop.nombre_jobs()
     neighbors = []
@@ -110,10 +91,10 @@ def create_insert_neighbors(flowshop):
         for j in range(nb_jobs):
             if j != i and (j != i - 1 or i == 0):
                 neighbors.append([i, j])
-    return neighbors
+    return np.array(neighbors, dtype=np.int32).reshape(-1, 2)
 
 
-def local_search_insert(scheduling, iteration, max_neighbors_nb, neighbors):
+def local_search_insert(scheduling, iteration, max_neighbors_nb, neighbors, times):
     """
     Returns a (new) scheduling after local search on the given initial scheduling during the maximum number of
     iterations given to find a minimum local, given an instance of the flowshop population (insert neighborhood)
@@ -121,36 +102,67 @@ def local_search_insert(scheduling, iteration, max_neighbors_nb, neighbors):
     :param scheduling: a scheduling (Ordonnancement object)
     :param iteration: maximum number of iterations (explorations of the insert neighborhood) to find a minimum local
     :param max_neighbors_nb: number of neighbors to visit at each iteration
-    :param neighbors: list of neighbors
+    :param neighbors: array of neighbors (see create_insert_neighbors)
+    :param times: matrix of the processing times of the flowshop (see Flowshop.durees)
+    :return: the scheduling after the given number of iteration of local search
+    """
+    return local_search_neighborhood(scheduling, iteration, max_neighbors_nb, neighbors, times, True)
+
+
+def neighbor_sequence(sequence, neighbor, insert):
+    """
+    Builds a neighbor of a sequence in the swap or insert neighborhood
+    :param sequence: list of jobs
+    :param neighbor: the two positions of the move (a row of create_swap_neighbors or create_insert_neighbors)
+    :param insert: True to move the job of the first position to the second one, False to swap the two positions
+    :return: the sequence of the neighbor (new list)
+    """
+    first, second = int(neighbor[0]), int(neighbor[1])
+    new_sequence = sequence.copy()
+    if insert:
+        new_sequence.insert(second, new_sequence.pop(first))
+    else:
+        new_sequence[first], new_sequence[second] = new_sequence[second], new_sequence[first]
+    return new_sequence
+
+
+def local_search_neighborhood(scheduling, iteration, max_neighbors_nb, neighbors, times, insert):
+    """
+    Returns a (new) scheduling after local search on the given initial scheduling during the maximum number of
+    iterations given to find a minimum local, the sampled neighbors of an iteration are evaluated together from their
+    moves and only the accepted one is built
+    :param scheduling: a scheduling (Ordonnancement object)
+    :param iteration: maximum number of iterations (explorations of the neighborhood) to find a minimum local
+    :param max_neighbors_nb: number of neighbors to visit at each iteration
+    :param neighbors: array of neighbors (see create_swap_neighbors and create_insert_neighbors)
+    :param times: matrix of the processing times of the flowshop (see Flowshop.durees)
+    :param insert: True for the insert neighborhood, False for the swap neighborhood
     :return: the scheduling after the given number of iteration of local search
     """
-    best_scheduling = copy.copy(scheduling)
-    candidate = copy.copy(scheduling)
-    duration = best_scheduling.duree()
-    duration_candidate = candidate.duree()
+    sequence = scheduling.sequence()
+    perm = scheduling.permutation()
+    completion = scheduling.dates_fin()
+    duration = scheduling.duree()
     if max_neighbors_nb > len(neighbors):
         max_neighbors_nb = len(neighbors)
+    if max_neighbors_nb == 0:
+        return copy.copy(scheduling)
 
     for a in range(0, iteration):
-        visited_neighbors = neighbors.copy()
-        for k in range(max_neighbors_nb):
-            index = random.randint(0, len(visited_neighbors) - 1)
-            i, j = visited_neighbors[index][0], visited_neighbors[index][1]
-            visited_neighbors.pop(index)
-            temp = copy.copy(best_scheduling)
-            sequence = temp.sequence().copy()
-            ls_insert = sequence[i]
-            sequence.remove(ls_insert)
-            sequence.insert(j, ls_insert)
-            new_scheduling = Ordonnancement(temp.nb_machines)
-            new_scheduling.ordonnancer_liste_job(sequence)
-            duration_temp = new_scheduling.duree()
-            if duration_temp < duration_candidate:
-                duration_candidate = duration_temp
-                candidate = new_scheduling
-        if duration > duration_candidate:
-            best_scheduling = candidate
-            duration = duration_candidate
+        visited_neighbors = neighbors[random.sample(range(len(neighbors)), max_neighbors_nb)]
+        # a neighbor only differs from the current permutation from the first of its two positions, and its evaluation
+        # stops as soon as it cannot improve the current duration
+        durations = makespan.neighbors_makespan_batch(perm, times, completion, visited_neighbors, insert, duration)
+        index = np.argmin(durations)
+        if duration > durations[index]:
+            sequence = neighbor_sequence(sequence, visited_neighbors[index], insert)
+            perm = np.array([job.numero() for job in sequence], dtype=np.int32)
+            completion = makespan.completion_times(perm, times, np.zeros(times.shape[1], dtype=np.int32))
+            duration = durations[index]
         else:
             break
+    if sequence is scheduling.sequence():
+        return copy.copy(scheduling)
+    best_scheduling = Ordonnancement(scheduling.nb_machines)
+    best_scheduling.ordonnancer_liste_job(sequence)
     return best_scheduling
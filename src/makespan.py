@@ -0,0 +1,181 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # without Numba the kernels below run as plain Python functions (slow, but still correct)
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+    prange = range
+
+# cutoff of the evaluations which are never cut short (largest int32)
+NO_CUTOFF = 2147483647
+
+"""
+This python file implements the evaluation of the makespan (Cmax) of permutations for the flow-shop permutation problem
+with NumPy arrays, in order to score a whole batch of sequences in a single call instead of building an Ordonnancement
+object for each of them. The recurrence over the jobs and the machines is compiled with Numba (the compiled functions
+are cached on disk, so the compilation only happens at the first run) and the permutations of a batch are scored in
+parallel.
+
+A permutation is given as the numbers of its jobs (Job.numero()) and the processing times as a matrix whose row k holds
+the durations of the operations of the job number k.
+
+If the Cython extension _makespan.pyx has been compiled (see its header), its kernels replace the Numba ones below.
+"""
+
+
+def processing_times(jobs):
+    """
+    Builds the matrix of the processing times of the given jobs
+    :param jobs: list of Job objects (all the jobs of an instance of the flow-shop permutation problem)
+    :return: int32 array of shape (max job number + 1, nb_machines), the row k is the durations of the job number k
+    """
+    nb_machines = jobs[0].nb_op
+    times = np.zeros((max(job.numero() for job in jobs) + 1, nb_machines), dtype=np.int32)
+    for job in jobs:
+        times[job.numero()] = job.duree_op
+    return times
+
+
+def permutation_matrix(sequences):
+    """
+    Converts sequences of jobs into a matrix of job numbers
+    :param sequences: list of sequences (lists of Job objects) of the same length
+    :return: int32 array of shape (nb_sequences, nb_jobs)
+    """
+    return np.array([[job.numero() for job in sequence] for sequence in sequences], dtype=np.int32)
+
+
+@njit(cache=True)
+def completion_times(perm, times, release):
+    """
+    Computes the completion times of the operations of the jobs of the permutation, scheduled in this order on machines
+    that are available from the given dates
+    :param perm: int32 array of shape (nb_jobs,), the row indices in times of the jobs to schedule
+    :param times: int32 array of shape (_, nb_machines), the processing times
+    :param release: int32 array of shape (nb_machines,), date from which each machine is available
+    :return: int32 array of shape (nb_jobs, nb_machines), C[j, k] is the completion time of the job j on the machine k
+    """
+    nb_jobs = perm.shape[0]
+    nb_machines = times.shape[1]
+    completion = np.empty((nb_jobs, nb_machines), dtype=np.int32)
+    for j in range(nb_jobs):
+        job = perm[j]
+        for k in range(nb_machines):
+            ready = release[k] if j == 0 else completion[j - 1, k]
+            if k > 0 and completion[j, k - 1] > ready:
+                ready = completion[j, k - 1]
+            completion[j, k] = ready + times[job, k]
+    return completion
+
+
+@njit(cache=True)
+def makespan(perm, times):
+    """
+    Computes the makespan of a single permutation, only the completion times of the last scheduled job are kept
+    :param perm: int32 array of shape (nb_jobs,), the row indices in times of the jobs in the order of the sequence
+    :param times: int32 array of shape (_, nb_machines), the processing times
+    :return: the makespan of the permutation
+    """
+    nb_machines = times.shape[1]
+    completion = np.zeros(nb_machines, dtype=np.int32)
+    for j in range(perm.shape[0]):
+        job = perm[j]
+        completion[0] += times[job, 0]
+        for k in range(1, nb_machines):
+            if completion[k - 1] > completion[k]:
+                completion[k] = completion[k - 1]
+            completion[k] += times[job, k]
+    return completion[nb_machines - 1]
+
+
+@njit(cache=True, parallel=True)
+def makespan_batch(perm_matrix, times):
+    """
+    Computes the makespan of each permutation of the batch, the permutations are independent so they are scored in
+    parallel over the available cores
+    :param perm_matrix: int32 array of shape (nb_permutations, nb_jobs), each row is a permutation of job numbers
+    :param times: matrix of the processing times (see processing_times)
+    :return: int32 array of shape (nb_permutations,) with the makespan of each permutation
+    """
+    nb_permutations = perm_matrix.shape[0]
+    durations = np.empty(nb_permutations, dtype=np.int32)
+    for i in prange(nb_permutations):
+        durations[i] = makespan(perm_matrix[i], times)
+    return durations
+
+
+@njit(cache=True)
+def neighbor_position(j, first, second, insert):
+    """
+    Gives the position in a permutation of the job placed at the given position in one of its neighbors
+    :param j: position in the neighbor
+    :param first: first position of the move (position of the moved job for an insert move)
+    :param second: second position of the move (new position of the moved job for an insert move)
+    :param insert: True for an insert move, False for a swap of the two positions
+    :return: the position of the job in the permutation
+    """
+    if not insert:
+        if j == first:
+            return second
+        if j == second:
+            return first
+        return j
+    if j == second:
+        return first
+    # the jobs between the two positions are shifted by one position towards the old position of the moved job
+    if first < second and first <= j < second:
+        return j + 1
+    if first > second and second < j <= first:
+        return j - 1
+    return j
+
+
+@njit(cache=True, parallel=True)
+def neighbors_makespan_batch(perm, times, completion, neighbors, insert, cutoff=NO_CUTOFF):
+    """
+    Computes the makespan of neighbors of a permutation directly from the moves which give them, without building the
+    neighbor permutations: the completion times of the prefix shared with the permutation are reused and only the jobs
+    from the first position of the move, read through the move, are scheduled again
+    :param perm: int32 array of shape (nb_jobs,), the permutation of job numbers
+    :param times: matrix of the processing times (see processing_times)
+    :param completion: int32 array of shape (nb_jobs, nb_machines), the completion times of the permutation
+    :param neighbors: int32 array of shape (nb_neighbors, 2), the two positions of each move
+    :param insert: True for insert moves, False for swap moves
+    :param cutoff: the evaluation of a neighbor stops as soon as the completion time of a job on the last machine
+    reaches the cutoff, this date is a lower bound of the makespan since the completion times only increase along the
+    sequence
+    :return: int32 array of shape (nb_neighbors,) with the makespan of each neighbor (or a value greater than or equal
+    to the cutoff)
+    """
+    nb_neighbors = neighbors.shape[0]
+    nb_machines = times.shape[1]
+    durations = np.empty(nb_neighbors, dtype=np.int32)
+    for i in prange(nb_neighbors):
+        first = neighbors[i, 0]
+        second = neighbors[i, 1]
+        start = min(first, second)
+        if start > 0:
+            row = completion[start - 1].copy()
+        else:
+            row = np.zeros(nb_machines, dtype=np.int32)
+        for j in range(start, perm.shape[0]):
+            job = perm[neighbor_position(j, first, second, insert)]
+            row[0] += times[job, 0]
+            for k in range(1, nb_machines):
+                if row[k - 1] > row[k]:
+                    row[k] = row[k - 1]
+                row[k] += times[job, k]
+            if row[nb_machines - 1] >= cutoff:
+                break
+        durations[i] = row[nb_machines - 1]
+    return durations
+
+
+try:
+    # the kernels are replaced together so that the Numba functions never call the compiled ones
+    from src._makespan import completion_times, makespan, makespan_batch, neighbors_makespan_batch
+except ImportError:
+    pass
@@ -7,18 +7,22 @@
 # The 3 last stages are iterated several times
 
 import time
+import random
+import numpy as np
 from src import initial_population, mutation, local_search, solution_crossover, population_statistics
-from src.convergence import is_convergent, initialize_threshold
+from src.convergence import initialize_threshold
+from src.population import Population
 
 
-def update_population(population, flowshop, parameters, swap_neighbors, insert_neighbors):
+def update_population(population, flowshop, parameters, swap_neighbors, insert_neighbors, rng):
     """
     update_population function called when building a new generation of population
     :param population: population to update
     :param flowshop: instance of the flowshop problem
     :param parameters: dictionary of parameters used in the function
-    :param swap_neighbors: the list of neighbors for the swap method
-    :param insert_neighbors: the list of neighbors for the insert method
+    :param swap_neighbors: array of the neighbors for the swap method (see create_swap_neighbors)
+    :param insert_neighbors: array of the neighbors for the insert method (see create_insert_neighbors)
+    :param rng: numpy random generator used by the crossover and the mutation
     :return: the updated population
     """
     population = solution_crossover.crossover(flowshop,
@@ -26,11 +30,13 @@ def update_population(population, flowshop, parameters, swap_neighbors, insert_n
                                               cross_1_point_prob=parameters['cross_1_point_prob'],
                                               cross_2_points_prob=parameters['cross_2_points_prob'],
                                               cross_position_prob=parameters['cross_position_prob'],
-                                              gentrification=parameters['gentrification'])
+                                              gentrification=parameters['gentrification'],
+                                              rng=rng)
     population = mutation.mutation(flowshop,
                                    population,
                                    mutation_swap_probability=parameters['mut_swap_prob'],
-                                   mutation_insert_probability=parameters['mut_insert_prob'])
+                                   mutation_insert_probability=parameters['mut_insert_prob'],
+                                   rng=rng)
     if parameters['use_ls']:
         population = local_search.local_search(population,
                                                maximum_nb_iterations=parameters['ls_max_iterations'],
@@ -39,36 +45,38 @@ def update_population(population, flowshop, parameters, swap_neighbors, insert_n
                                                max_neighbors_nb=parameters['max_neighbors_nb'],
                                                swap_neighbors=swap_neighbors,
                                                insert_neighbors=insert_neighbors,
-                                               nb_sched=parameters['ls_subset_size'])
+                                               nb_sched=parameters['ls_subset_size'],
+                                               times=flowshop.durees())
     return population
 
 
-def restart_population(population, flowshop, preserved_prop):
+def restart_population(population, flowshop, preserved_prop, rng):
     """
     restart_population function called when the population is convergent
-    :param population: population to restart
+    :param population: population to restart (Population object)
     :param flowshop: instance of the flowshop problem
     :param preserved_prop: proportion to preserve
-    :return: the new population
+    :param rng: numpy random generator used to draw the new random schedulings
+    :return: the new population (list of Ordonnancement objects)
     """
-    preserved_size = int(len(population) * preserved_prop)
-    random_size = len(population) - preserved_size
-    return (extract_best_from_population(population, preserved_size) +
-            initial_population.random_initial_pop(flowshop, random_size))
+    preserved_size = int(population.size() * preserved_prop)
+    random_size = population.size() - preserved_size
+    new_population = extract_best_from_population(population, preserved_size)
+    new_population.extend(initial_population.random_initial_pop(flowshop, random_size, rng))
+    return new_population
 
 
 def extract_best_from_population(population, preserved_size):
     """
-    Extracts the preserved_prop proportion of the list list_sched that has the lowest durations
-    :param population: list of Ordonnancement objects
+    Extracts the preserved_size schedulings of the population that have the lowest durations
+    :param population: Population object
     :param preserved_size: number of schedulings to extract from the population
     :return: the list of schedulings (Ordonnancement objects) with the lowest durations of the given size
     """
-    sorted_list = sorted(population, key=lambda sched: sched.duree(), reverse=False)
-    return sorted_list[:preserved_size]
+    return population.best_schedulings(preserved_size)
 
 
-def memetic_heuristic(flowshop, parameters):
+def memetic_heuristic(flowshop, parameters, rng=None):
     """
         memetic heuristic for the flowshop problem
         :param flowshop: instance of flowshop
@@ -77,46 +85,61 @@ def memetic_heuristic(flowshop, parameters):
             'time_limit', 'cross_1_point_prob', 'cross_2_points_prob','cross_position_prob', 'gentrification',
             'mut_swap_prob', 'mut_insert_prob', 'preserved_prop', 'ls_max_iterations', 'ls_swap_prob', 'ls_insert_prob',
             'max_neighbors_nb', 'use_ls', 'ls_subset_size'
+        :param rng: numpy random generator used for the random draws of the run, if None it is seeded from the random
+        module so that random.seed() makes the runs reproducible
         :return: the statistics (mean, min, max) over the generations of the function memetic_heuristic, the scheduling
         (Ordonnancement object) with the lowest duration, the list of iterations where a restart happened
         """
-    start_time = time.time()
+    # the loop stops when the next iteration, assumed to last as long as the previous one, could end less than 1 second
+    # before the time limit
+    deadline = time.monotonic() + 60 * parameters['time_limit'] - 1
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
     swap_neighbors = local_search.create_swap_neighbors(flowshop)
     insert_neighbors = local_search.create_insert_neighbors(flowshop)
     entropy_threshold = initialize_threshold(parameters['pop_init_size'])
     population = initial_population.initial_pop(flowshop,
                                                 random_prop=parameters['random_prop'],
                                                 deter_prop=parameters['deter_prop'],
+                                                rng=rng,
                                                 best_deter=parameters['best_deter'],
                                                 pop_init_size=parameters['pop_init_size'])
-    initial_statistics = population_statistics.population_statistics(population)
-    list_statistics = [initial_statistics]
-    overall_best_scheduling = min(population, key=lambda sched: sched.duree())
+    initial_generation = Population(population)
+    list_statistics = [population_statistics.duration_statistics(initial_generation)]
+    # number of consecutive generations (the last one included) with the same best duration
+    nb_same_best = 1
+    overall_best_scheduling = initial_generation.best()
     iterations_where_restart = []
     index = 0
     iteration_time = 0
-    while time.time() - start_time + iteration_time + 1 < 60 * parameters['time_limit']:
+    while time.monotonic() + iteration_time < deadline:
         index += 1
-        start_time_iteration = time.time()
-        population = update_population(population, flowshop, parameters, swap_neighbors, insert_neighbors)
-        best_sched = min(population, key=lambda sched: sched.duree())
+        start_time_iteration = time.monotonic()
+        population = update_population(population, flowshop, parameters, swap_neighbors, insert_neighbors, rng)
+        generation = Population(population)
+        best_sched = generation.best()
 
         if overall_best_scheduling.duree() > best_sched.duree():
             overall_best_scheduling = best_sched
-        statistics = population_statistics.population_statistics(population)
-        list_statistics.append(statistics)
+        if best_sched.duree() == list_statistics[-1][1]:
+            nb_same_best += 1
+        else:
+            nb_same_best = 1
 
         restart = False
         # if the best duration doesn't improve much over 10 iterations, the population is restarted
-        if len(list_statistics) > 9 and (iterations_where_restart == [] or index >= iterations_where_restart[-1] + 10) \
-                and min([list_statistics[k][1] for k in range(max(0, len(list_statistics)-10), len(list_statistics))]) \
-                == max([list_statistics[k][1] for k in range(max(0, len(list_statistics)-10), len(list_statistics))]):
+        if nb_same_best >= 10 and (iterations_where_restart == [] or index >= iterations_where_restart[-1] + 10):
             restart = True
 
-        if is_convergent(population, threshold=entropy_threshold) or restart:
+        # the entropy of the population is only computed when the best duration alone does not trigger the restart
+        statistics, convergent = population_statistics.statistics_and_convergence(generation, entropy_threshold,
+                                                                                  skip_entropy=restart)
+        list_statistics.append(statistics)
+        if restart or convergent:
             iterations_where_restart.append(index)
-            population = restart_population(population,
+            population = restart_population(generation,
                                             flowshop,
-                                            preserved_prop=parameters['preserved_prop'])
-        iteration_time = time.time() - start_time_iteration
+                                            preserved_prop=parameters['preserved_prop'],
+                                            rng=rng)
+        iteration_time = time.monotonic() - start_time_iteration
     return list_statistics, overall_best_scheduling, iterations_where_restart
@@ -1,5 +1,6 @@
 import random
 import copy
+import numpy as np
 from src.ordonnancement import Ordonnancement
 
 """
@@ -11,12 +12,13 @@ method indices, conditions...) and its function calls everywhere else in the pro
 """
 
 
-def mutation(flowshop, population, mutation_swap_probability=0.4, mutation_insert_probability=0.4):
+def mutation(flowshop, population, rng, mutation_swap_probability=0.4, mutation_insert_probability=0.4):
     """
     Returns a new population after the all the mutation step given an instance of the flow-shop permutation problem, a
     population and a mutation probability for each mutation function
     :param flowshop: a Flowshop object
     :param population: list of Ordonnancement objects
+    :param rng: numpy random generator used to draw the mutations
     :param mutation_swap_probability: probability for each Ordonnancement object in the population to mutate with the
     swap method mutation
     :param mutation_insert_probability: probability for each Ordonnancement object in the population to mutate with the
@@ -36,61 +38,74 @@ def mutation(flowshop, population, mutation_swap_probability=0.4, mutation_inser
     random.shuffle(order_of_mutations)
     for index_method in order_of_mutations:
         if index_method == 0 and swap_mutation_allowed:
-            mutated_population = mutation_swap(flowshop, mutated_population, mutation_swap_probability)
+            mutated_population = mutation_swap(flowshop, mutated_population, rng, mutation_swap_probability)
         elif index_method == 1 and insert_mutation_allowed:
-            mutated_population = mutation_insert(flowshop, mutated_population, mutation_insert_probability)
+            mutated_population = mutation_insert(flowshop, mutated_population, rng, mutation_insert_probability)
     return mutated_population
 
 
-def mutation_swap(flowshop, population, mutation_probability=0.4):
+def mutation_swap(flowshop, population, rng, mutation_probability=0.4):
     """
     Returns a new population after mutation given an instance of the flowshop permutation problem, a population and a
     mutation probability (swap method)
+    The random decisions of the whole population are drawn at once
     :param flowshop: a Flowshop object
     :param population: list of Ordonnancement objects
+    :param rng: numpy random generator used to draw the mutations
     :param mutation_probability: probability for each Ordonnancement object in the population to mutate
     :return: the population after mutation
     """
-    nb_jobs = flowshop.nombre_jobs()
-    mutated_population = []
-    for sched in population:
-        if random.random() < mutation_probability:
-            sequence = sched.sequence().copy()
-            indices = [j for j in range(nb_jobs)]
-            a, b = random.sample(indices, 2)
-            sequence[a], sequence[b] = sequence[b], sequence[a]
+    mutated_indices, positions_a, positions_b = draw_mutations(flowshop.nombre_jobs(), len(population),
+                                                               mutation_probability, rng)
+    mutated_population = copy.copy(population)
+    for index, a, b in zip(mutated_indices, positions_a, positions_b):
+        sched = population[index]
+        sequence = sched.sequence().copy()
+        sequence[a], sequence[b] = sequence[b], sequence[a]
 
-            mutated_sched = Ordonnancement(sched.nb_machines)
-            mutated_sched.ordonnancer_liste_job(sequence)
-            mutated_population.append(mutated_sched)
-        else:
-            mutated_population.append(sched)
+        mutated_sched = Ordonnancement(sched.nb_machines)
+        mutated_sched.ordonnancer_liste_job(sequence)
+        mutated_population[index] = mutated_sched
     return mutated_population
 
 
-def mutation_insert(flowshop, population, mutation_probability=0.4):
+def mutation_insert(flowshop, population, rng, mutation_probability=0.4):
     """
     Returns a new population after mutation given an instance of the flowshop permutation problem, a population and a
     mutation probability (insert method)
+    The random decisions of the whole population are drawn at once
     :param flowshop: a Flowshop object
     :param population: list of Ordonnancement objects
+    :param rng: numpy random generator used to draw the mutations
     :param mutation_probability: probability for each Ordonnancement object in the population to mutate
     :return: the population after mutation
     """
-    nb_jobs = flowshop.nombre_jobs()
-    mutated_population = []
-    for sched in population:
-        if random.random() < mutation_probability:
-            sequence = sched.sequence().copy()
-            indices = [i for i in range(nb_jobs)]
-            elt_index, insert_index = random.sample(indices, 2)
-            temp = sequence[elt_index]
-            sequence.remove(temp)
-            sequence.insert(insert_index, temp)
+    mutated_indices, elt_indices, insert_indices = draw_mutations(flowshop.nombre_jobs(), len(population),
+                                                                  mutation_probability, rng)
+    mutated_population = copy.copy(population)
+    for index, elt_index, insert_index in zip(mutated_indices, elt_indices, insert_indices):
+        sched = population[index]
+        sequence = sched.sequence().copy()
+        temp = sequence.pop(elt_index)
+        sequence.insert(insert_index, temp)
 
-            mutated_sched = Ordonnancement(sched.nb_machines)
-            mutated_sched.ordonnancer_liste_job(sequence)
-            mutated_population.append(mutated_sched)
-        else:
-            mutated_population.append(sched)
+        mutated_sched = Ordonnancement(sched.nb_machines)
+        mutated_sched.ordonnancer_liste_job(sequence)
+        mutated_population[index] = mutated_sched
     return mutated_population
+
+
+def draw_mutations(nb_jobs, population_size, mutation_probability, rng):
+    """
+    Draws which schedulings of a population mutate and, for each of them, two distinct positions in its sequence
+    :param nb_jobs: number of jobs of the flow shop
+    :param population_size: number of schedulings in the population
+    :param mutation_probability: probability for each scheduling to mutate
+    :param rng: numpy random generator
+    :return: the list of the indices of the mutated schedulings and the two lists of their positions
+    """
+    mutated_indices = np.flatnonzero(rng.random(population_size) < mutation_probability)
+    positions_a = rng.integers(0, nb_jobs, len(mutated_indices))
+    # adding a non-zero shift modulo nb_jobs gives a second position uniformly drawn among the other ones
+    positions_b = (positions_a + rng.integers(1, nb_jobs, len(mutated_indices))) % nb_jobs
+    return mutated_indices.tolist(), positions_a.tolist(), positions_b.tolist()
@@ -6,21 +6,31 @@
 __author__ = 'Chams Lahlou'
 __date__ = 'Octobre 2019'
 
-from src import job
+import numpy as np
+from src import job, makespan
 
 
 class Ordonnancement:
 
+    # attributs déclarés une fois pour toutes : les ordonnancements sont créés par milliers
+    # (population, enfants des croisements, mutations), sans dictionnaire d'attributs par instance
+    __slots__ = ('seq', 'nb_machines', 'dur', 'date_dispo', 'fin', 'perm')
+
     # constructeur pour un ordonnancement vide
     def __init__(self, nb_machines):
         # séquence des jobs
         self.seq = []
         # nombre de machiners
         self.nb_machines = nb_machines
-        # durée totale de l'ordonnancement
+        # durée totale de l'ordonnancement, tenue à jour à chaque job ordonnancé :
+        # duree() se contente de la lire et ne rejoue jamais le calcul
         self.dur = 0
         # date à partir de laquelle chaque machine est libre
         self.date_dispo = [0 for i in range(self.nb_machines)]
+        # matrice des dates de fin des opérations (calculée à la demande)
+        self.fin = None
+        # numéros des jobs de la séquence dans un tableau int32 contigu (calculé à la demande)
+        self.perm = None
 
     def duree(self):
         return self.dur
@@ -28,9 +38,24 @@ class Ordonnancement:
     def sequence(self):
         return self.seq
 
+    # séquence des numéros des jobs, sous la forme attendue par les calculs de makespan.py
+    def permutation(self):
+        if self.perm is None:
+            self.perm = np.array([job.numero() for job in self.seq], dtype=np.int32)
+        return self.perm
+
     def date_disponibilite(self, num_machine):
         return self.date_dispo[num_machine]
 
+    # matrice (nb_jobs x nb_machines) des dates de fin des opérations des jobs de la séquence,
+    # conservée pour que le calcul des voisins de l'ordonnancement reparte du préfixe qu'ils partagent
+    def dates_fin(self):
+        if self.fin is None:
+            durees = np.array([job.duree_op for job in self.seq], dtype=np.int32).reshape(-1, self.nb_machines)
+            self.fin = makespan.completion_times(np.arange(len(self.seq), dtype=np.int32), durees,
+                                                 np.zeros(self.nb_machines, dtype=np.int32))
+        return self.fin
+
     def date_debut_operation(self, job, operation):
         return job.date_deb[operation]
 
@@ -52,6 +77,8 @@ class Ordonnancement:
     # ajoute un job dans l'ordonnancement
     # à la suite de ceux déjà ordonnancés
     def ordonnancer_job(self, job):
+        self.fin = None
+        self.perm = None
         self.seq += [job]
         for mach in range(self.nb_machines):
             if mach == 0:  # première machine
@@ -65,9 +92,20 @@ class Ordonnancement:
 
     # ajoute les jobs d'une liste dans l'ordonnancement
     # à la suite de ceux déjà ordonnancés
+    # les dates sont calculées en une fois pour toute la liste (calcul compilé avec Numba)
     def ordonnancer_liste_job(self, liste_jobs):
-        for job in liste_jobs:
-            self.ordonnancer_job(job)
+        if len(liste_jobs) == 0:
+            return
+        durees = np.array([job.duree_op for job in liste_jobs], dtype=np.int32)
+        fin = makespan.completion_times(np.arange(len(liste_jobs), dtype=np.int32), durees,
+                                        np.array(self.date_dispo, dtype=np.int32))
+        for job, dates in zip(liste_jobs, (fin - durees).tolist()):
+            job.date_deb = dates
+        self.fin = fin if len(self.seq) == 0 else None
+        self.perm = None
+        self.seq += liste_jobs
+        self.date_dispo = fin[-1].tolist()
+        self.dur = max(self.dur, self.date_dispo[self.nb_machines - 1])
 
     def has_duplicate(self):
         seq = self.sequence()
@@ -0,0 +1,37 @@
+import numpy as np
+
+"""
+This python file implements a struct of arrays view of a population of schedulings for the memetic algorithm: the
+sequences are stored in a single int32 matrix (one row of job numbers per scheduling) and the durations in a single
+int32 vector, so that the scans of the whole population (selection of the best schedulings, statistics, convergence)
+are array operations instead of Python loops over the Ordonnancement objects.
+"""
+
+
+class Population:
+    def __init__(self, schedulings):
+        # list of the schedulings (Ordonnancement objects) of the population
+        self.schedulings = schedulings
+        # matrix (size of the population x nb_jobs) of the job numbers of each scheduling
+        self.perm = np.array([sched.permutation() for sched in schedulings], dtype=np.int32)
+        # duration of each scheduling
+        self.duree = np.array([sched.duree() for sched in schedulings], dtype=np.int32)
+
+    def size(self):
+        return len(self.schedulings)
+
+    def best(self):
+        """
+        :return: the scheduling (Ordonnancement object) of the population with the lowest duration
+        """
+        return self.schedulings[np.argmin(self.duree)]
+
+    def best_schedulings(self, size):
+        """
+        Selects the schedulings with the lowest durations, in no particular order
+        :param size: number of schedulings to select
+        :return: list of the selected schedulings (Ordonnancement objects)
+        """
+        if size >= self.size():
+            return list(self.schedulings)
+        return [self.schedulings[index] for index in np.argpartition(self.duree, size)[:size]]
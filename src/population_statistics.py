@@ -1,6 +1,33 @@
 import statistics
+import numpy as np
+from src.convergence import permutations_entropy
 
 
 def population_statistics(population):
     pop_duration = [sched.duree() for sched in population]
     return statistics.mean(pop_duration), min(pop_duration), max(pop_duration)
+
+
+def duration_statistics(population):
+    """
+    computes the statistics of the durations of the population from its vector of durations
+    :param population: Population object
+    :return: the statistics (mean, min, max) of the durations
+    """
+    durations = population.duree
+    return float(np.mean(durations)), int(np.min(durations)), int(np.max(durations))
+
+
+def statistics_and_convergence(population, threshold, skip_entropy=False):
+    """
+    computes the statistics of the population and checks its convergence from the arrays of the population, in place of
+    two separate scans of the schedulings with population_statistics and is_convergent
+    :param population: Population object
+    :param threshold: threshold of entropy
+    :param skip_entropy: if True, the entropy is not computed (the convergence is not needed, e.g. when the population
+    is restarted anyway) and the population is considered as not convergent
+    :return: the statistics (mean, min, max) of the durations and True if the entropy of the population is lesser than
+    the threshold
+    """
+    convergent = not skip_entropy and permutations_entropy(population.perm) < threshold
+    return duration_statistics(population), convergent
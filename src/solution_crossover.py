@@ -1,16 +1,22 @@
 import random
+import numpy as np
+from src import makespan
 from src.ordonnancement import Ordonnancement
 
 
-def crossover(flowshop, initial_pop, cross_1_point_prob, cross_2_points_prob, cross_position_prob, gentrification):
+def crossover(flowshop, initial_pop, cross_1_point_prob, cross_2_points_prob, cross_position_prob, gentrification,
+              rng):
     """
     Generates a new population by crossing schedulings of the previous one
+    The durations of all the children are computed in a single batch and only the children kept in the new population
+    are built as Ordonnancement objects
     :param flowshop: an instance of the flow shop permutation problem
     :param initial_pop: population of schedulings to cross
     :param cross_1_point_prob: the probability of using the 1 point crossover method for each pair of parent
     :param cross_2_points_prob: the probability of using the 2 points crossover method for each pair of parent
     :param cross_position_prob: the probability of using the position crossover method for each pair of parent
     :param gentrification: if True, the parents are crossed by duration, else randomly
+    :param rng: numpy random generator used to draw the crossover methods and points
     :return population: the population with crossed schedulings
     """
     sum_prop = cross_1_point_prob + cross_2_points_prob + cross_position_prob
@@ -20,26 +26,48 @@ def crossover(flowshop, initial_pop, cross_1_point_prob, cross_2_points_prob, cr
     nb_jobs = flowshop.nombre_jobs()
     population = initial_pop.copy()
     population_size = len(population)
+    if population_size == 0:
+        return population
     if gentrification:
         population = sorted(population, key=lambda sched: sched.duree(), reverse=False)
     else:
         random.shuffle(population)
-    indices = [i for i in range(nb_jobs)]
-    for j in range(0, len(population), 2):
-        method_random = random.random()
+    # the method and the points of every pair of parents are drawn at once
+    nb_pairs = len(range(0, len(population), 2))
+    methods_random = rng.random(nb_pairs)
+    points = rng.integers(0, nb_jobs + 1, nb_pairs).tolist()
+    # the two distinct points are only drawn for the pairs crossed with the 2 points method (they need two jobs)
+    nb_two_points = int(np.count_nonzero((methods_random >= cross_1_point_prob)
+                                         & (methods_random < cross_1_point_prob + cross_2_points_prob)))
+    points1 = rng.integers(0, nb_jobs, nb_two_points)
+    points2 = iter(((points1 + rng.integers(1, nb_jobs, nb_two_points)) % nb_jobs).tolist())
+    points1 = iter(points1.tolist())
+    methods_random = methods_random.tolist()
+    children_seq = []
+    for pair, j in enumerate(range(0, len(population), 2)):
+        seq1 = population[j].sequence()
+        seq2 = population[j+1].sequence()
+        method_random = methods_random[pair]
         if method_random < cross_1_point_prob:
-            point = random.randint(0, nb_jobs)
-            children_temp = crossover_1_point(population[j], population[j+1], point)
+            children_seq += crossover_1_point_sequences(seq1, seq2, points[pair])
         elif method_random < cross_1_point_prob + cross_2_points_prob:
-            point1, point2 = random.sample(indices, 2)
-            children_temp = crossover_2_points(population[j], population[j+1], point1, point2)
+            children_seq += crossover_2_points_sequences(seq1, seq2, next(points1), next(points2))
         else:
-            children_temp = crossover_position(population[j], population[j+1])
-        for child in children_temp:
-            population.append(child)
-    population = sorted(population, key=lambda sched: sched.duree(), reverse=False)
-    population = population[0:population_size]
-    return population
+            children_seq += crossover_position_sequences(seq1, seq2)
+    children_durations = makespan.makespan_batch(makespan.permutation_matrix(children_seq), flowshop.durees())
+    durations = np.concatenate(([sched.duree() for sched in population], children_durations))
+    # stable sort: on ties, parents are kept before children as in a sort of the parents followed by the children
+    kept_indices = np.argsort(durations, kind='stable')[0:population_size]
+    nb_machines = population[0].nb_machines
+    new_population = []
+    for index in kept_indices:
+        if index < population_size:
+            new_population.append(population[index])
+        else:
+            child = Ordonnancement(nb_machines)
+            child.ordonnancer_liste_job(children_seq[index - population_size])
+            new_population.append(child)
+    return new_population
 
 
 def crossover_2_points(sched1, sched2, point1, point2):
@@ -51,10 +79,21 @@ def crossover_2_points(sched1, sched2, point1, point2):
     :param point2: second point of the interval to swap, INTEGER between 0 and nb_jobs, different of point1
     :return population: the two children schedulings (Ordonnancement objects)
     """
-    nb_jobs = len(sched1.sequence())
+    return schedule_sequences(sched1.nb_machines,
+                              crossover_2_points_sequences(sched1.sequence(), sched2.sequence(), point1, point2))
+
+
+def crossover_2_points_sequences(seq1, seq2, point1, point2):
+    """
+    Crosses two sequences of jobs with the 2 points method
+    :param seq1: sequence of the parent 1 (list of Job objects)
+    :param seq2: sequence of the parent 2 (list of Job objects)
+    :param point1: first point of the interval to swap, INTEGER between 0 and nb_jobs
+    :param point2: second point of the interval to swap, INTEGER between 0 and nb_jobs, different of point1
+    :return: the two children sequences
+    """
+    nb_jobs = len(seq1)
     point1, point2 = min(point1, point2), max(point1, point2)
-    seq1 = sched1.sequence().copy()
-    seq2 = sched2.sequence().copy()
     seq11 = seq1[0:point1]
     seq12 = seq1[point1:point2]
     seq13 = seq1[point2:nb_jobs]
@@ -75,12 +114,7 @@ def crossover_2_points(sched1, sched2, point1, point2):
         list_exclude[1].pop(k)
     new_seq1 = seq11 + seq22 + seq13
     new_seq2 = seq21 + seq12 + seq23
-    nb_machines = sched1.nb_machines
-    scheduling1 = Ordonnancement(nb_machines)
-    scheduling2 = Ordonnancement(nb_machines)
-    scheduling1.ordonnancer_liste_job(new_seq1)
-    scheduling2.ordonnancer_liste_job(new_seq2)
-    return [scheduling1, scheduling2]
+    return [new_seq1, new_seq2]
 
 
 def crossover_1_point(sched1, sched2, point1):
@@ -91,8 +125,18 @@ def crossover_1_point(sched1, sched2, point1):
     :param point1: separation point to swap the sub-sequences, INTEGER between 0 and nb_jobs
     :return population: the two children schedulings (Ordonnancement objects)
     """
-    seq1 = sched1.sequence().copy()
-    seq2 = sched2.sequence().copy()
+    return schedule_sequences(sched1.nb_machines,
+                              crossover_1_point_sequences(sched1.sequence(), sched2.sequence(), point1))
+
+
+def crossover_1_point_sequences(seq1, seq2, point1):
+    """
+    Crosses two sequences of jobs with the 1 point method
+    :param seq1: sequence of the parent 1 (list of Job objects)
+    :param seq2: sequence of the parent 2 (list of Job objects)
+    :param point1: separation point to swap the sub-sequences, INTEGER between 0 and nb_jobs
+    :return: the two children sequences
+    """
     seq11 = seq1[0:point1]
     seq12 = seq1[point1:]
     seq21 = seq2[0:point1]
@@ -111,12 +155,7 @@ def crossover_1_point(sched1, sched2, point1):
         list_exclude[1].pop(k)
     new_seq1 = seq11 + seq22
     new_seq2 = seq21 + seq12
-    nb_machines = sched1.nb_machines
-    scheduling1 = Ordonnancement(nb_machines)
-    scheduling2 = Ordonnancement(nb_machines)
-    scheduling1.ordonnancer_liste_job(new_seq1)
-    scheduling2.ordonnancer_liste_job(new_seq2)
-    return [scheduling1, scheduling2]
+    return [new_seq1, new_seq2]
 
 
 def crossover_position(sched1, sched2):
@@ -127,8 +166,16 @@ def crossover_position(sched1, sched2):
     :param sched2: the second parent
     :return: the new Ordonnancenement object
     """
-    seq1 = sched1.sequence()
-    seq2 = sched2.sequence()
+    return schedule_sequences(sched1.nb_machines, crossover_position_sequences(sched1.sequence(), sched2.sequence()))
+
+
+def crossover_position_sequences(seq1, seq2):
+    """
+    Crosses two sequences of jobs with the position method (see crossover_position)
+    :param seq1: sequence of the parent 1 (list of Job objects)
+    :param seq2: sequence of the parent 2 (list of Job objects)
+    :return: the child sequence in a list
+    """
     positionschild = [0] * len(seq1)
     for i in range(len(seq1)):
         job = seq1[i]
@@ -144,7 +191,19 @@ def crossover_position(sched1, sched2):
         next_job = seq1[index_next_job]
         childseq.append(next_job)
         positionschild[index_next_job] = 2 * len(seq1) + 1
-    nb_machines = sched1.nb_machines
-    childsched = Ordonnancement(nb_machines)
-    childsched.ordonnancer_liste_job(childseq)
-    return [childsched]
+    return [childseq]
+
+
+def schedule_sequences(nb_machines, sequences):
+    """
+    Builds a scheduling for each given sequence
+    :param nb_machines: number of machines of the flow shop
+    :param sequences: list of sequences (lists of Job objects)
+    :return: the list of schedulings (Ordonnancement objects)
+    """
+    schedulings = []
+    for sequence in sequences:
+        scheduling = Ordonnancement(nb_machines)
+        scheduling.ordonnancer_liste_job(sequence)
+        schedulings.append(scheduling)
+    return schedulings
@@ -1,2 +1,2 @@
-from test import test_initial_population, test_job, test_local_search, test_mutation, test_ordonnancement, \
-    test_solution_crossover
+from test import test_convergence, test_initial_population, test_job, test_local_search, test_makespan, \
+    test_mutation, test_ordonnancement, test_population, test_solution_crossover
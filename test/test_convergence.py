@@ -0,0 +1,41 @@
+import unittest
+from src.job import Job
+from src.ordonnancement import Ordonnancement
+from src.convergence import shannon_entropy, permutations_entropy
+from src.makespan import permutation_matrix
+from src.population import Population
+from src.population_statistics import statistics_and_convergence, population_statistics
+
+job_1 = Job(1, [1, 1, 1, 1, 10])
+job_2 = Job(2, [1, 1, 1, 4, 8])
+job_3 = Job(3, [2, 1, 3, 5, 1])
+sequences = [[job_1, job_2, job_3], [job_2, job_1, job_3], [job_1, job_2, job_3], [job_3, job_2, job_1],
+             [job_1, job_2, job_3]]
+
+
+class TestConvergenceFileMethods(unittest.TestCase):
+    def test_permutations_entropy(self):
+        population = []
+        for sequence in sequences:
+            scheduling = Ordonnancement(job_1.nb_op)
+            scheduling.ordonnancer_liste_job(sequence)
+            population.append(scheduling)
+        self.assertAlmostEqual(permutations_entropy(permutation_matrix(sequences)), shannon_entropy(population))
+        self.assertEqual(permutations_entropy(permutation_matrix(sequences[0:1])), 0)
+
+    def test_statistics_and_convergence(self):
+        population = []
+        for sequence in sequences:
+            scheduling = Ordonnancement(job_1.nb_op)
+            scheduling.ordonnancer_liste_job(sequence)
+            population.append(scheduling)
+        statistics, convergent = statistics_and_convergence(Population(population), threshold=2)
+        self.assertEqual(statistics, population_statistics(population))
+        self.assertTrue(convergent)
+        statistics, convergent = statistics_and_convergence(Population(population), threshold=2, skip_entropy=True)
+        self.assertEqual(statistics, population_statistics(population))
+        self.assertFalse(convergent)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from src import initial_population as ip
 from src.job import Job
 from src.flowshop import Flowshop
@@ -20,20 +21,21 @@ flowshop_2.definir_par("data\\dataset3\\jeu2.txt")
 seq_1 = [job_3, job_1, job_5, job_2, job_4]
 seq_2 = [job_1, job_2, job_4, job_3, job_5]
 seq_3 = [job_1, job_4, job_3, job_2, job_5]
+rng = np.random.default_rng()
 
 
 class MyTestCase(unittest.TestCase):
     def test_initial_population_warnings(self):
         size = 100
         with self.assertWarns(Warning):  # Deterministic prop too high
-            ip.initial_pop(flowshop_1, 0.5, 0.5, False, size)
+            ip.initial_pop(flowshop_1, 0.5, 0.5, rng, False, size)
         size = 150
         with self.assertWarns(Warning):  # Size too high
-            ip.initial_pop(flowshop_1, 1.0, 0.0, False, size)
+            ip.initial_pop(flowshop_1, 1.0, 0.0, rng, False, size)
 
     def test_initial_pop(self):
         size = 100
-        init_pop = ip.initial_pop(flowshop_1, 0.9, 0.1, False, size)
+        init_pop = ip.initial_pop(flowshop_1, 0.9, 0.1, rng, False, size)
         for sched in init_pop:
             self.assertEqual(len(sched.sequence()), 5)
             self.assertEqual(sched.has_duplicate(), False)
@@ -46,7 +48,7 @@ class MyTestCase(unittest.TestCase):
 
     def test_random_initial_pop(self):
         rdm_size = 100
-        rdm_pop = ip.random_initial_pop(flowshop_1, rdm_size)
+        rdm_pop = ip.random_initial_pop(flowshop_1, rdm_size, rng)
         self.assertEqual(len(rdm_pop), rdm_size)
         for sched in rdm_pop:
             self.assertEqual(len(sched.sequence()), 5)
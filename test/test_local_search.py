@@ -4,14 +4,14 @@ from src.job import Job
 from src.ordonnancement import Ordonnancement
 from src.flowshop import Flowshop
 from src.local_search import local_search_swap, local_search_insert, swap, local_search, create_swap_neighbors, \
-    create_insert_neighbors
+    create_insert_neighbors, neighbor_sequence
 
 job_1 = Job(1, [1, 1, 1, 1, 10])
 job_2 = Job(2, [1, 1, 1, 4, 8])
 job_3 = Job(3, [2, 1, 3, 5, 1])
 job_4 = Job(4, [2, 5, 5, 3, 3])
 job_5 = Job(5, [1, 1, 3, 7, 1])
-flow_shop = Flowshop(5, 5)
+flow_shop = Flowshop(5, 5, [job_1, job_2, job_3, job_4, job_5])
 scheduling_1 = Ordonnancement(job_1.nb_op)
 scheduling_2 = Ordonnancement(job_2.nb_op)
 scheduling_1.ordonnancer_liste_job([job_2, job_3, job_4, job_5, job_1])
@@ -28,7 +28,7 @@ class TestSolutionLocalSearchClassMethods(unittest.TestCase):
         new_pop = local_search(initial_pop, local_search_swap_prob=0.5, local_search_insert_prob=0.5,
                                maximum_nb_iterations=20, max_neighbors_nb=50, swap_neighbors=swap_neighbors,
                                insert_neighbors=insert_neighbors,
-                               nb_sched=2)
+                               nb_sched=2, times=flow_shop.durees())
         self.assertEqual(len(initial_pop), len(new_pop))
         self.assertTrue(sum([sched.duree() for sched in new_pop]) < sum([sched.duree() for sched in initial_pop]))
         for scheduling in new_pop:
@@ -39,8 +39,11 @@ class TestSolutionLocalSearchClassMethods(unittest.TestCase):
 
     def test_duration_ls_swap(self):
         swap_neighbors = create_swap_neighbors(flow_shop)
-        new_scheduling_1 = local_search_swap(scheduling_1, 20, max_neighbors_nb=50, neighbors=swap_neighbors)
-        new_scheduling_2 = local_search_swap(scheduling_2, 20, max_neighbors_nb=50, neighbors=swap_neighbors)
+        times = flow_shop.durees()
+        new_scheduling_1 = local_search_swap(scheduling_1, 20, max_neighbors_nb=50,
+                                             neighbors=swap_neighbors, times=times)
+        new_scheduling_2 = local_search_swap(scheduling_2, 20, max_neighbors_nb=50,
+                                             neighbors=swap_neighbors, times=times)
         self.assertTrue(new_scheduling_1.duree() <= scheduling_1.duree())
         self.assertTrue(new_scheduling_2.duree() <= scheduling_2.duree())
         self.assertEqual(len(new_scheduling_1.sequence()), 5)
@@ -51,8 +54,11 @@ class TestSolutionLocalSearchClassMethods(unittest.TestCase):
 
     def test_duration_ls_insert(self):
         insert_neighbors = create_insert_neighbors(flow_shop)
-        new_scheduling_1 = local_search_insert(scheduling_1, 20, max_neighbors_nb=50, neighbors=insert_neighbors)
-        new_scheduling_2 = local_search_insert(scheduling_2, 20, max_neighbors_nb=50, neighbors=insert_neighbors)
+        times = flow_shop.durees()
+        new_scheduling_1 = local_search_insert(scheduling_1, 20, max_neighbors_nb=50,
+                                               neighbors=insert_neighbors, times=times)
+        new_scheduling_2 = local_search_insert(scheduling_2, 20, max_neighbors_nb=50,
+                                               neighbors=insert_neighbors, times=times)
         self.assertTrue(new_scheduling_1.duree() <= scheduling_1.duree())
         self.assertTrue(new_scheduling_2.duree() <= scheduling_2.duree())
         self.assertEqual(len(new_scheduling_1.sequence()), 5)
@@ -87,6 +93,8 @@ class TestSolutionLocalSearchClassMethods(unittest.TestCase):
         self.assertEqual(expected_size_neighborhood, len(expected_neighborhood))
         self.assertEqual(expected_size_neighborhood, len(computed_neighborhood))
         self.assertEqual(expected_neighborhood, computed_neighborhood)
+        self.assertEqual(expected_neighborhood, [neighbor_sequence(initial_scheduling.sequence(), neighbor, False)
+                                                 for neighbor in create_swap_neighbors(flow_shop)])
 
     def test_insert_neighborhood(self):
         nb_jobs = flow_shop.nombre_jobs()
@@ -126,6 +134,8 @@ class TestSolutionLocalSearchClassMethods(unittest.TestCase):
         self.assertEqual(expected_size_neighborhood, len(expected_neighborhood))
         self.assertEqual(expected_size_neighborhood, len(computed_neighborhood))
         self.assertEqual(expected_neighborhood, computed_neighborhood)
+        self.assertEqual(expected_neighborhood, [neighbor_sequence(initial_scheduling.sequence(), neighbor, True)
+                                                 for neighbor in create_insert_neighbors(flow_shop)])
 
     def test_improvement_with_ls(self):
         job_a = Job(0, [1, 5])
@@ -135,8 +145,11 @@ class TestSolutionLocalSearchClassMethods(unittest.TestCase):
         insert_neighbors = create_insert_neighbors(flow_shop_2)
         scheduling = Ordonnancement(job_a.nb_op)
         scheduling.ordonnancer_liste_job([job_b, job_a])
-        new_scheduling_swap = local_search_swap(scheduling, 1, max_neighbors_nb=50, neighbors=swap_neighbors)
-        new_scheduling_insert = local_search_insert(scheduling, 1, max_neighbors_nb=50, neighbors=insert_neighbors)
+        times = flow_shop_2.durees()
+        new_scheduling_swap = local_search_swap(scheduling, 1, max_neighbors_nb=50,
+                                                neighbors=swap_neighbors, times=times)
+        new_scheduling_insert = local_search_insert(scheduling, 1, max_neighbors_nb=50,
+                                                    neighbors=insert_neighbors, times=times)
         self.assertTrue(scheduling.duree() == 11)
         self.assertTrue(new_scheduling_swap.duree() < scheduling.duree())
         self.assertTrue(new_scheduling_insert.duree() < scheduling.duree())
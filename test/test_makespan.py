@@ -0,0 +1,74 @@
+import unittest
+from src.job import Job
+from src.ordonnancement import Ordonnancement
+import numpy as np
+from src.makespan import processing_times, permutation_matrix, makespan_batch, makespan, completion_times, \
+    neighbors_makespan_batch
+from src.local_search import neighbor_sequence
+
+job_1 = Job(1, [1, 1, 1, 1, 10])
+job_2 = Job(2, [1, 1, 1, 4, 8])
+job_3 = Job(3, [2, 1, 3, 5, 1])
+job_4 = Job(4, [2, 5, 5, 3, 3])
+job_5 = Job(5, [1, 1, 3, 7, 1])
+sequences = [[job_2, job_3, job_4, job_5, job_1],
+             [job_1, job_4, job_5, job_2, job_3],
+             [job_5, job_4, job_3, job_2, job_1]]
+
+
+class TestMakespanFileMethods(unittest.TestCase):
+    def test_processing_times(self):
+        times = processing_times([job_3, job_1])
+        self.assertEqual(times.shape, (4, 5))
+        self.assertEqual(list(times[1]), [1, 1, 1, 1, 10])
+        self.assertEqual(list(times[3]), [2, 1, 3, 5, 1])
+
+    def test_makespan_batch(self):
+        times = processing_times([job_1, job_2, job_3, job_4, job_5])
+        durations = makespan_batch(permutation_matrix(sequences), times)
+        self.assertEqual(len(durations), len(sequences))
+        for sequence, duration in zip(sequences, durations):
+            scheduling = Ordonnancement(job_1.nb_op)
+            scheduling.ordonnancer_liste_job(sequence)
+            self.assertEqual(scheduling.duree(), duration)
+
+    def test_makespan(self):
+        times = processing_times([job_1, job_2, job_3, job_4, job_5])
+        for perm, duration in zip(permutation_matrix(sequences), makespan_batch(permutation_matrix(sequences), times)):
+            self.assertEqual(makespan(perm, times), duration)
+
+    def test_completion_times(self):
+        times = processing_times([job_1, job_2, job_3, job_4, job_5])
+        perm_matrix = permutation_matrix(sequences)
+        completion = completion_times(perm_matrix[0], times, np.zeros(5, dtype=np.int32))
+        self.assertEqual(completion.shape, (5, 5))
+        self.assertEqual(completion[-1, -1], makespan(perm_matrix[0], times))
+
+    def test_neighbors_makespan_batch(self):
+        times = processing_times([job_1, job_2, job_3, job_4, job_5])
+        perm = permutation_matrix(sequences)[0]
+        completion = completion_times(perm, times, np.zeros(5, dtype=np.int32))
+        moves = np.array([[i, j] for i in range(5) for j in range(5) if i != j], dtype=np.int32)
+        for insert in [False, True]:
+            durations = neighbors_makespan_batch(perm, times, completion, moves, insert)
+            neighbors = permutation_matrix([neighbor_sequence(sequences[0], move, insert) for move in moves])
+            self.assertEqual(list(durations), list(makespan_batch(neighbors, times)))
+
+    def test_neighbors_makespan_batch_cutoff(self):
+        times = processing_times([job_1, job_2, job_3, job_4, job_5])
+        perm = permutation_matrix(sequences)[0]
+        completion = completion_times(perm, times, np.zeros(5, dtype=np.int32))
+        moves = np.array([[i, j] for i in range(5) for j in range(5) if i != j], dtype=np.int32)
+        exact_durations = neighbors_makespan_batch(perm, times, completion, moves, True)
+        cutoff = int(np.median(exact_durations))
+        durations = neighbors_makespan_batch(perm, times, completion, moves, True, cutoff)
+        for duration, exact_duration in zip(durations, exact_durations):
+            if exact_duration < cutoff:
+                self.assertEqual(duration, exact_duration)
+            else:
+                self.assertGreaterEqual(duration, cutoff)
+                self.assertLessEqual(duration, exact_duration)
+
+
+if __name__ == '__main__':
+    unittest.main()
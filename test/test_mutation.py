@@ -1,5 +1,6 @@
 import unittest
-from src.mutation import mutation, mutation_insert, mutation_swap
+import numpy as np
+from src.mutation import mutation, mutation_insert, mutation_swap, draw_mutations
 from src.flowshop import Flowshop
 from src.job import Job
 from src.ordonnancement import Ordonnancement
@@ -17,11 +18,12 @@ scheduling_1.ordonnancer_liste_job([job_2, job_3, job_4, job_5, job_1])
 scheduling_2.ordonnancer_liste_job([job_1, job_4, job_5, job_2, job_3])
 scheduling_3.ordonnancer_liste_job([job_5, job_4, job_3, job_2, job_1])
 initial_pop = [scheduling_1, scheduling_2, scheduling_3]
+rng = np.random.default_rng()
 
 
 class TestMutationFileMethods(unittest.TestCase):
     def test_mutation_swap(self):
-        new_pop = mutation_swap(flow_shop, initial_pop, mutation_probability=1.0)
+        new_pop = mutation_swap(flow_shop, initial_pop, rng, mutation_probability=1.0)
         self.assertEqual(len(initial_pop), len(new_pop))
         for scheduling in new_pop:
             self.assertEqual(len(scheduling.sequence()), 5)
@@ -30,7 +32,7 @@ class TestMutationFileMethods(unittest.TestCase):
                 self.assertIn(job, scheduling.sequence())
 
     def test_mutation_insert(self):
-        new_pop = mutation_insert(flow_shop, initial_pop, mutation_probability=1.0)
+        new_pop = mutation_insert(flow_shop, initial_pop, rng, mutation_probability=1.0)
         self.assertEqual(len(initial_pop), len(new_pop))
         for scheduling in new_pop:
             self.assertEqual(len(scheduling.sequence()), 5)
@@ -39,7 +41,7 @@ class TestMutationFileMethods(unittest.TestCase):
                 self.assertIn(job, scheduling.sequence())
 
     def test_mutation(self):
-        new_pop = mutation(flow_shop, initial_pop, mutation_swap_probability=1.0, mutation_insert_probability=1.0)
+        new_pop = mutation(flow_shop, initial_pop, rng, mutation_swap_probability=1.0, mutation_insert_probability=1.0)
         self.assertEqual(len(initial_pop), len(new_pop))
         for sched in new_pop:
             self.assertEqual(len(sched.sequence()), 5)
@@ -47,6 +49,18 @@ class TestMutationFileMethods(unittest.TestCase):
             for job in [job_1, job_2, job_3, job_4, job_5]:
                 self.assertIn(job, sched.sequence())
 
+    def test_draw_mutations(self):
+        mutated_indices, positions_a, positions_b = draw_mutations(5, 100, 0.5, rng)
+        self.assertEqual(len(mutated_indices), len(positions_a))
+        self.assertEqual(len(mutated_indices), len(positions_b))
+        self.assertEqual(mutated_indices, sorted(set(mutated_indices)))
+        for a, b in zip(positions_a, positions_b):
+            self.assertNotEqual(a, b)
+            self.assertIn(a, range(5))
+            self.assertIn(b, range(5))
+        self.assertEqual(draw_mutations(5, 100, 1.0, rng)[0], list(range(100)))
+        self.assertEqual(draw_mutations(5, 100, 0.0, rng)[0], [])
+
 
 if __name__ == '__main__':
     unittest.main()
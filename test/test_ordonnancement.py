@@ -20,6 +20,36 @@ class TestOrdonnancementClassMethods(unittest.TestCase):
         self.assertEqual(ord_1, ord_3)
         self.assertNotEqual(ord_1, ord_2)
 
+    def test_ordonnancer_liste_job(self):
+        ord_4 = Ordonnancement(job_1.nb_op)
+        for job in [job_2, job_3, job_4, job_5, job_1]:
+            ord_4.ordonnancer_job(job)
+        ord_5 = Ordonnancement(job_1.nb_op)
+        ord_5.ordonnancer_liste_job([job_2, job_3])
+        ord_5.ordonnancer_liste_job([job_4, job_5, job_1])
+        self.assertEqual(ord_4, ord_5)
+        self.assertEqual(ord_4.duree(), ord_1.duree())
+
+    def test_dates_fin(self):
+        ord_4 = Ordonnancement(job_1.nb_op)
+        ord_4.ordonnancer_liste_job([job_2, job_3])
+        ord_4.ordonnancer_job(job_4)
+        fin = ord_4.dates_fin()
+        self.assertEqual(fin.shape, (3, 5))
+        for position, job in enumerate(ord_4.sequence()):
+            for mach in range(job.nb_op):
+                self.assertEqual(fin[position, mach],
+                                 ord_4.date_debut_operation(job, mach) + job.duree_operation(mach))
+        self.assertEqual(fin[-1, -1], ord_4.duree())
+
+    def test_permutation(self):
+        self.assertEqual(ord_1.permutation().tolist(), [2, 3, 4, 5, 1])
+        ord_4 = Ordonnancement(job_1.nb_op)
+        ord_4.ordonnancer_liste_job([job_2, job_3])
+        self.assertEqual(ord_4.permutation().tolist(), [2, 3])
+        ord_4.ordonnancer_job(job_4)
+        self.assertEqual(ord_4.permutation().tolist(), [2, 3, 4])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from src.job import Job
+from src.ordonnancement import Ordonnancement
+from src.population import Population
+
+job_1 = Job(1, [1, 1, 1, 1, 10])
+job_2 = Job(2, [1, 1, 1, 4, 8])
+job_3 = Job(3, [2, 1, 3, 5, 1])
+job_4 = Job(4, [2, 5, 5, 3, 3])
+job_5 = Job(5, [1, 1, 3, 7, 1])
+scheduling_1 = Ordonnancement(job_1.nb_op)
+scheduling_2 = Ordonnancement(job_1.nb_op)
+scheduling_3 = Ordonnancement(job_1.nb_op)
+scheduling_1.ordonnancer_liste_job([job_2, job_3, job_4, job_5, job_1])
+scheduling_2.ordonnancer_liste_job([job_1, job_4, job_5, job_2, job_3])
+scheduling_3.ordonnancer_liste_job([job_5, job_4, job_3, job_2, job_1])
+schedulings = [scheduling_1, scheduling_2, scheduling_3]
+
+
+class TestPopulationClassMethods(unittest.TestCase):
+    def test_arrays(self):
+        population = Population(schedulings)
+        self.assertEqual(population.size(), 3)
+        self.assertEqual(population.perm.shape, (3, 5))
+        self.assertEqual(list(population.perm[1]), [1, 4, 5, 2, 3])
+        self.assertEqual(list(population.duree), [sched.duree() for sched in schedulings])
+
+    def test_best(self):
+        population = Population(schedulings)
+        self.assertEqual(population.best().duree(), min(sched.duree() for sched in schedulings))
+
+    def test_best_schedulings(self):
+        population = Population(schedulings)
+        sorted_durations = sorted(sched.duree() for sched in schedulings)
+        for size in range(0, 5):
+            best = population.best_schedulings(size)
+            self.assertEqual(len(best), min(size, 3))
+            self.assertEqual(sorted(sched.duree() for sched in best), sorted_durations[:size])
+
+
+if __name__ == '__main__':
+    unittest.main()
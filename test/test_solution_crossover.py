@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from src.solution_crossover import crossover_2_points, crossover, crossover_1_point, crossover_position
 from src.flowshop import Flowshop
 from src.job import Job
@@ -9,6 +10,7 @@ job_2 = Job(2, [1, 1, 1, 4, 8])
 job_3 = Job(3, [2, 1, 3, 5, 1])
 job_4 = Job(4, [2, 5, 5, 3, 3])
 job_5 = Job(5, [1, 1, 3, 7, 1])
+rng = np.random.default_rng()
 
 
 class TestSolutionCrossoverFileMethods(unittest.TestCase):
@@ -58,12 +60,13 @@ class TestSolutionCrossoverFileMethods(unittest.TestCase):
         parent_1.ordonnancer_liste_job([job_2, job_3, job_4, job_5, job_1])
         parent_2.ordonnancer_liste_job([job_1, job_4, job_5, job_2, job_3])
         initial_pop = [parent_1, parent_2]
-        flowshop = Flowshop(5, 5)
+        flowshop = Flowshop(5, 5, [job_1, job_2, job_3, job_4, job_5])
         new_pop = crossover(flowshop, initial_pop,
                             cross_1_point_prob=0.5,
                             cross_2_points_prob=0.5,
                             cross_position_prob=0.3,
-                            gentrification=True)
+                            gentrification=True,
+                            rng=rng)
         self.assertEqual(len(initial_pop), len(new_pop))
         for sched in new_pop:
             self.assertEqual(len(sched.sequence()), 5)
@@ -71,6 +74,20 @@ class TestSolutionCrossoverFileMethods(unittest.TestCase):
             for job in [job_1, job_2, job_3, job_4, job_5]:
                 self.assertIn(job, sched.sequence())
 
+    def test_crossover_single_job(self):
+        parent = Ordonnancement(job_1.nb_op)
+        parent.ordonnancer_liste_job([job_1])
+        flowshop = Flowshop(1, 5, [job_1])
+        new_pop = crossover(flowshop, [parent, parent],
+                            cross_1_point_prob=1,
+                            cross_2_points_prob=0,
+                            cross_position_prob=0,
+                            gentrification=True,
+                            rng=rng)
+        self.assertEqual(len(new_pop), 2)
+        for sched in new_pop:
+            self.assertEqual(sched.sequence(), [job_1])
+
 
 if __name__ == '__main__':
     unittest.main()